@@ -8,6 +8,7 @@ from asyncio import iscoroutinefunction, run, ensure_future
 from collections import defaultdict
 from importlib import import_module
 from inspect import isasyncgenfunction
+from sys import intern
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing import TYPE_CHECKING
 
@@ -550,7 +551,8 @@ class Client(Dispatcher):
         try:
             key, args, kwargs = await self.handle_middleware(payload, name)
 
-            self.event_mgr.process_events(key, *args)
+            # Interned so the event manager lookup can compare by identity.
+            self.event_mgr.process_events(intern(key), *args)
 
             if calls := self.get_event_coro(key):
                 self.execute_event(calls, *args, **kwargs)
@@ -612,7 +614,8 @@ class Client(Dispatcher):
         Returns
         ------
         Any
-            What the Discord API returns for this event.
+            What the Discord API returns for this event. A tuple is only
+            returned for events which have multiple arguments.
         """
         return await self.event_mgr.wait_for(event_name, check, timeout)
 
@@ -640,7 +643,8 @@ class Client(Dispatcher):
         Yields
         ------
         Any
-            What the Discord API returns for this event.
+            What the Discord API returns for this event. A tuple is only
+            yielded for events which have multiple arguments.
         """
         return self.event_mgr.loop_for(
             event_name,
@@ -7,7 +7,7 @@ from asyncio import sleep
 from json import dumps
 from typing import Protocol, TYPE_CHECKING
 
-from aiohttp import ClientSession, ClientResponse
+from aiohttp import ClientSession, ClientResponse, TCPConnector
 
 from . import __package__
 from .._config import GatewayConfig
@@ -71,10 +71,10 @@ class HTTPClient:
         self.url: str = f"https://discord.com/api/v{version}"
         self.max_ttl: int = ttl
 
-        headers: Dict[str, str] = {
+        self.__headers: Dict[str, str] = {
             "Authorization": f"Bot {token}",
         }
-        self.__session: ClientSession = ClientSession(headers=headers)
+        self.__client_session: Optional[ClientSession] = None
 
         self.__http_exceptions: Dict[int, HTTPError] = {
             304: NotModifiedError(),
@@ -86,6 +86,22 @@ class HTTPClient:
             429: RateLimitError()
         }
 
+    @property
+    def __session(self) -> ClientSession:
+        """The aiohttp session which is shared by all requests of this
+        client. It is created on the first request, so it belongs to the
+        running event loop, and keeps its connections alive between requests.
+        Once the client is closed its requests fail instead of opening a new
+        session.
+        """
+        if self.__client_session is None:
+            self.__client_session = ClientSession(
+                headers=self.__headers,
+                connector=TCPConnector(limit=100, keepalive_timeout=75)
+            )
+
+        return self.__client_session
+
     # for with block
     async def __aenter__(self):
         return self
@@ -98,7 +114,8 @@ class HTTPClient:
 
         Closes the aiohttp session
         """
-        await self.__session.close()
+        if self.__client_session is not None:
+            await self.__client_session.close()
 
     async def __send(
             self,
@@ -0,0 +1,7 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+# Augmenting declarations for `channel.py`, only used when pincer is
+# compiled with Cython. See `setup.py`.
+
+cpdef object _build_channel(object client, dict data)
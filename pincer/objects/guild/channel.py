@@ -3,20 +3,23 @@
 
 from __future__ import annotations
 
-from asyncio import sleep, ensure_future
-from dataclasses import dataclass
+from asyncio import Semaphore, ensure_future, gather, get_running_loop
+from dataclasses import dataclass, fields, MISSING as NO_DEFAULT
 from enum import IntEnum
-from typing import overload, TYPE_CHECKING
+from functools import lru_cache
+from math import ceil
+from typing import TYPE_CHECKING
 
 from ..message.user_message import UserMessage
 from ..._config import GatewayConfig
+from ...exceptions import ForbiddenError
 from ...utils.api_object import APIObject
 from ...utils.conversion import construct_client_dict
 from ...utils.convert_message import convert_message
 from ...utils.types import MISSING
 
 if TYPE_CHECKING:
-    from typing import Dict, List, Optional, Union
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
     from .member import GuildMember
     from .overwrite import Overwrite
@@ -73,6 +76,19 @@ class ChannelType(IntEnum):
 
     GUILD_STAGE_VOICE = 13
 
+    @staticmethod
+    def __factory__(value: int) -> ChannelType:
+        # Used by APIObject to convert the raw type of channel payloads.
+        return _to_channel_type(value)
+
+
+@lru_cache(maxsize=None)
+def _to_channel_type(value: int) -> ChannelType:
+    """Get the channel type of a raw type value. Cached, as the channel type
+    is looked up for every channel payload.
+    """
+    return ChannelType(value)
+
 
 @dataclass
 class Channel(APIObject):  # noqa E501
@@ -183,51 +199,110 @@ class Channel(APIObject):  # noqa E501
         return f"<#{self.id}>"
 
     @classmethod
-    async def from_id(cls, client: Client, channel_id: int) -> Channel:
-        # TODO: Write docs
-        data = (await client.http.get(f"channels/{channel_id}")) or {}
+    def from_dict(cls, data: Dict[str, Any]) -> Channel:
+        """Parse a channel object from a dictionary.
 
-        data.update(construct_client_dict(
-            client,
-            {"type": ChannelType(data.pop("type"))}
-        ))
+        Uses a constructor call which is generated once per channel class,
+        instead of inspecting the ``__init__`` signature for every channel.
+        """
+        if isinstance(data, cls):
+            return data
 
-        channel_cls = _channel_type_map.get(data["type"], Channel)
-        return channel_cls.from_dict(data)
+        try:
+            from_dict = _from_dict_cache[cls]
+        except KeyError:
+            from_dict = _from_dict_cache[cls] = _create_from_dict(cls)
 
-    @overload
-    async def edit(
-            self, *, name: str = None,
-            type: ChannelType = None,
-            position: int = None, topic: str = None, nsfw: bool = None,
-            rate_limit_per_user: int = None, bitrate: int = None,
-            user_limit: int = None,
-            permissions_overwrites: List[Overwrite] = None,
-            parent_id: Snowflake = None, rtc_region: str = None,
-            video_quality_mod: int = None,
-            default_auto_archive_duration: int = None
-    ) -> Channel:
-        ...
+        return from_dict(data)
+
+    @classmethod
+    async def from_id(cls, client: Client, channel_id: int) -> Channel:
+        # TODO: Write docs
+        data = (await client.http.get(f"channels/{channel_id}")) or {}
+        return _build_channel(client, data)
 
     async def edit(
             self,
             reason: Optional[str] = None,
-            **kwargs
-    ):
-        """Edit a channel with the given keyword arguments.
+            *,
+            name: APINullable[str] = MISSING,
+            type: APINullable[ChannelType] = MISSING,
+            position: APINullable[Optional[int]] = MISSING,
+            topic: APINullable[Optional[str]] = MISSING,
+            nsfw: APINullable[Optional[bool]] = MISSING,
+            rate_limit_per_user: APINullable[Optional[int]] = MISSING,
+            bitrate: APINullable[Optional[int]] = MISSING,
+            user_limit: APINullable[Optional[int]] = MISSING,
+            permission_overwrites: APINullable[
+                Optional[List[Overwrite]]
+            ] = MISSING,
+            parent_id: APINullable[Optional[Snowflake]] = MISSING,
+            rtc_region: APINullable[Optional[str]] = MISSING,
+            video_quality_mode: APINullable[Optional[int]] = MISSING,
+            default_auto_archive_duration: APINullable[Optional[int]] = MISSING
+    ) -> Channel:
+        """Edit a channel. Only the given attributes are changed.
 
         Parameters
         ----------
         reason Optional[:class:`str`]
-            The reason of the channel delete.
-        \\*\\*kwargs :
-            The keyword arguments to edit the channel with.
+            The reason of the channel edit.
+        name APINullable[:class:`str`]
+            The name of the channel (1-100 characters)
+        type APINullable[:class:`~pincer.objects.guild.channel.ChannelType`]
+            The type of channel, only conversion between text and news is
+            supported
+        position APINullable[Optional[:class:`int`]]
+            Sorting position of the channel
+        topic APINullable[Optional[:class:`str`]]
+            The channel topic (0-1024 characters)
+        nsfw APINullable[Optional[:class:`bool`]]
+            Whether the channel is nsfw
+        rate_limit_per_user APINullable[Optional[:class:`int`]]
+            Amount of seconds a user has to wait before sending another
+            message (0-21600)
+        bitrate APINullable[Optional[:class:`int`]]
+            The bitrate (in bits) of the voice channel
+        user_limit APINullable[Optional[:class:`int`]]
+            The user limit of the voice channel
+        permission_overwrites APINullable[Optional[List[:class:`~pincer.objects.guild.overwrite.Overwrite`]]]
+            Explicit permission overwrites for members and roles
+        parent_id APINullable[Optional[:class:`~pincer.utils.snowflake.Snowflake`]]
+            Id of the new parent category for the channel
+        rtc_region APINullable[Optional[:class:`str`]]
+            Voice region id for the voice channel, automatic when set to null
+        video_quality_mode APINullable[Optional[:class:`int`]]
+            The camera video quality mode of the voice channel
+        default_auto_archive_duration APINullable[Optional[:class:`int`]]
+            Default duration for newly created threads to automatically
+            archive the thread after recent activity
 
         Returns
         -------
         :class:`~pincer.objects.guild.channel.Channel`
             The updated channel object.
-        """
+        """  # noqa: E501
+        body = {
+            key: value for key, value in (
+                ("name", name),
+                ("type", type),
+                ("position", position),
+                ("topic", topic),
+                ("nsfw", nsfw),
+                ("rate_limit_per_user", rate_limit_per_user),
+                ("bitrate", bitrate),
+                ("user_limit", user_limit),
+                ("permission_overwrites", permission_overwrites),
+                ("parent_id", parent_id),
+                ("rtc_region", rtc_region),
+                ("video_quality_mode", video_quality_mode),
+                (
+                    "default_auto_archive_duration",
+                    default_auto_archive_duration
+                )
+            ) if value is not MISSING
+        }
+
         headers = {}
 
         if reason is not None:
@@ -235,15 +310,10 @@ class Channel(APIObject):  # noqa E501
 
         data = await self._http.patch(
             f"channels/{self.id}",
-            kwargs,
+            body,
             headers=headers
         )
-        data.update(construct_client_dict(
-            self._client,
-            {"type": ChannelType(data.pop("type"))}
-        ))
-        channel_cls = _channel_type_map.get(data["type"], Channel)
-        return channel_cls.from_dict(data)
+        return _build_channel(self._client, data)
 
     async def delete(
             self,
@@ -274,31 +344,99 @@ class Channel(APIObject):  # noqa E501
             headers
         )
 
-    async def __post_send_handler(self, message: Message):
-        """Process a message after it was sent.
+    async def bulk_delete(self, message_ids: List[Snowflake]):
+        """|coro|
+
+        Delete multiple messages of the channel. Messages are deleted with
+        bulk delete requests of up to 100 messages, which are sent
+        concurrently. A single message is deleted with a normal delete
+        request. Requires the ``MANAGE_MESSAGES`` permission, unless only a
+        single message sent by the current user is deleted.
 
         Parameters
         ----------
-        message :class:`~.pincer.objects.message.message.Message`
-            The message.
+        message_ids List[:class:`~.pincer.utils.Snowflake`]
+            The ids of the messages to delete.
         """
+        async def delete_chunk(chunk: List[Snowflake]):
+            if len(chunk) == 1:
+                await self._http.delete(
+                    f"channels/{self.id}/messages/{chunk[0]}"
+                )
+            else:
+                await self._http.post(
+                    f"channels/{self.id}/messages/bulk-delete",
+                    {"messages": chunk}
+                )
+
+        await gather(*(
+            delete_chunk(message_ids[i:i + 100])
+            for i in range(0, len(message_ids), 100)
+        ))
 
-        if getattr(message, "delete_after", None):
-            await sleep(message.delete_after)
-            await self.delete()
+    async def __delete_scheduled(self, message_ids: List[Snowflake]):
+        """|coro|
 
-    def __post_sent(
-            self,
-            message: Message
-    ):
-        """Ensure the `__post_send_handler` method its future.
+        Delete messages which were scheduled with ``delete_after``.
+        Bulk deletes require the ``MANAGE_MESSAGES`` permission, which
+        deleting the bot its own messages doesn't, so the messages are
+        deleted one by one if the bot is not allowed to bulk delete.
 
         Parameters
         ----------
-        message :class:`~.pincer.objects.message.message.Message`
-            The message.
+        message_ids List[:class:`~.pincer.utils.Snowflake`]
+            The ids of the messages to delete.
         """
-        ensure_future(self.__post_send_handler(message))
+        try:
+            await self.bulk_delete(message_ids)
+        except ForbiddenError:
+            if len(message_ids) == 1:
+                raise
+
+            await gather(*(
+                self._http.delete(f"channels/{self.id}/messages/{message_id}")
+                for message_id in message_ids
+            ))
+
+    def __flush_deletes(self, when: float):
+        """Delete the messages which were scheduled for ``when``.
+
+        Parameters
+        ----------
+        when :class:`float`
+            The loop time the messages were scheduled for.
+        """
+        ensure_future(self.__delete_scheduled(self.__pending_deletes.pop(when)))
+
+    def __delete_after(self, message_id: Snowflake, delay: float):
+        """Schedule a sent message to be deleted.
+
+        Messages which are due within the same 100ms are deleted together.
+
+        Parameters
+        ----------
+        message_id :class:`~.pincer.utils.Snowflake`
+            The id of the sent message.
+        delay :class:`float`
+            The amount of seconds after which the message is deleted.
+        """
+        # Ids of the sent messages waiting to be deleted, by the loop time
+        # at which they are deleted. This is scheduling state and not API
+        # data, so it isn't a dataclass field.
+        try:
+            pending_deletes = self.__pending_deletes
+        except AttributeError:
+            pending_deletes = self.__pending_deletes = {}
+
+        loop = get_running_loop()
+        when = ceil((loop.time() + delay) * 10) / 10
+
+        if when in pending_deletes:
+            pending_deletes[when].append(message_id)
+            return
+
+        pending_deletes[when] = [message_id]
+        loop.call_at(when, self.__flush_deletes, when)
 
     async def send(self, message: Union[Embed, Message, str]) -> UserMessage:
         """|coro|
@@ -315,17 +453,52 @@ class Channel(APIObject):  # noqa E501
         :class:`~.pincer.objects.message.user_message.UserMessage`
             The message that was sent.
         """
-        content_type, data = convert_message(self._client, message).serialize()
+        message = convert_message(self._client, message)
+        content_type, data = message.serialize()
 
         resp = await self._http.post(
             f"channels/{self.id}/messages",
             data,
             content_type=content_type
         )
-        msg = UserMessage.from_dict(resp)
-        self.__post_sent(msg)
+        msg = UserMessage.from_dict(construct_client_dict(self._client, resp))
+
+        if message.delete_after:
+            self.__delete_after(msg.id, message.delete_after)
+
         return msg
 
+    async def bulk_send(
+            self,
+            messages: List[Union[Embed, Message, str]],
+            max_concurrency: int = 10
+    ) -> List[UserMessage]:
+        """|coro|
+
+        Send multiple messages in the channel concurrently. The messages
+        are not guaranteed to arrive in the given order.
+
+        Parameters
+        ----------
+        messages List[:class:`~.pincer.objects.message.message.Message`]
+            The messages which must be sent.
+        max_concurrency :class:`int`
+            The maximum amount of messages which are being sent at once.
+            |default| ``10``
+
+        Returns
+        -------
+        List[:class:`~.pincer.objects.message.user_message.UserMessage`]
+            The messages that were sent, in the same order as ``messages``.
+        """
+        semaphore = Semaphore(max_concurrency)
+
+        async def send(message: Union[Embed, Message, str]) -> UserMessage:
+            async with semaphore:
+                return await self.send(message)
+
+        return await gather(*map(send, messages))
+
     def __str__(self):
         """return the discord tag when object gets used as a string."""
         return self.name or str(self.id)
@@ -334,31 +507,44 @@ class Channel(APIObject):  # noqa E501
 class TextChannel(Channel):
     """A subclass of ``Channel`` for text channels with all the same attributes."""
 
-    @overload
     async def edit(
-            self, name: str = None, type: ChannelType = None,
-            position: int = None, topic: str = None, nsfw: bool = None,
-            rate_limit_per_user: int = None,
-            permissions_overwrites: List[Overwrite] = None,
-            parent_id: Snowflake = None,
-            default_auto_archive_duration: int = None
+            self,
+            reason: Optional[str] = None,
+            *,
+            name: APINullable[str] = MISSING,
+            type: APINullable[ChannelType] = MISSING,
+            position: APINullable[Optional[int]] = MISSING,
+            topic: APINullable[Optional[str]] = MISSING,
+            nsfw: APINullable[Optional[bool]] = MISSING,
+            rate_limit_per_user: APINullable[Optional[int]] = MISSING,
+            permission_overwrites: APINullable[
+                Optional[List[Overwrite]]
+            ] = MISSING,
+            parent_id: APINullable[Optional[Snowflake]] = MISSING,
+            default_auto_archive_duration: APINullable[Optional[int]] = MISSING
     ) -> Union[TextChannel, NewsChannel]:
-        ...
+        """Edit a text channel. Only the given attributes are changed.
 
-    async def edit(self, **kwargs):
-        """Edit a text channel with the given keyword arguments.
-
-        Parameters
-        ----------
-        \\*\\*kwargs :
-            The keyword arguments to edit the channel with.
+        See :meth:`~pincer.objects.guild.channel.Channel.edit` for the
+        parameters.
 
         Returns
         -------
         :class:`~pincer.objects.guild.channel.Channel`
             The updated channel object.
         """
-        return await super().edit(**kwargs)
+        return await super().edit(
+            reason,
+            name=name,
+            type=type,
+            position=position,
+            topic=topic,
+            nsfw=nsfw,
+            rate_limit_per_user=rate_limit_per_user,
+            permission_overwrites=permission_overwrites,
+            parent_id=parent_id,
+            default_auto_archive_duration=default_auto_archive_duration
+        )
 
     async def fetch_message(self, message_id: int) -> UserMessage:
         """|coro|
@@ -384,29 +570,42 @@ class TextChannel(Channel):
 class VoiceChannel(Channel):
     """A subclass of ``Channel`` for voice channels with all the same attributes."""
 
-    @overload
     async def edit(
-            self, name: str = None, position: int = None, bitrate: int = None,
-            user_limit: int = None,
-            permissions_overwrites: List[Overwrite] = None,
-            rtc_region: str = None, video_quality_mod: int = None
+            self,
+            reason: Optional[str] = None,
+            *,
+            name: APINullable[str] = MISSING,
+            position: APINullable[Optional[int]] = MISSING,
+            bitrate: APINullable[Optional[int]] = MISSING,
+            user_limit: APINullable[Optional[int]] = MISSING,
+            permission_overwrites: APINullable[
+                Optional[List[Overwrite]]
+            ] = MISSING,
+            parent_id: APINullable[Optional[Snowflake]] = MISSING,
+            rtc_region: APINullable[Optional[str]] = MISSING,
+            video_quality_mode: APINullable[Optional[int]] = MISSING
     ) -> VoiceChannel:
-        ...
-
-    async def edit(self, **kwargs):
-        """Edit a text channel with the given keyword arguments.
+        """Edit a voice channel. Only the given attributes are changed.
 
-        Parameters
-        ----------
-        \\*\\*kwargs :
-            The keyword arguments to edit the channel with.
+        See :meth:`~pincer.objects.guild.channel.Channel.edit` for the
+        parameters.
 
         Returns
         -------
         :class:`~pincer.objects.guild.channel.Channel`
             The updated channel object.
         """
-        return await super().edit(**kwargs)
+        return await super().edit(
+            reason,
+            name=name,
+            position=position,
+            bitrate=bitrate,
+            user_limit=user_limit,
+            permission_overwrites=permission_overwrites,
+            parent_id=parent_id,
+            rtc_region=rtc_region,
+            video_quality_mode=video_quality_mode
+        )
 
 
 class CategoryChannel(Channel):
@@ -419,30 +618,42 @@ class CategoryChannel(Channel):
 class NewsChannel(Channel):
     """A subclass of ``Channel`` for news channels with all the same attributes."""
 
-    @overload
     async def edit(
-            self, name: str = None, type: ChannelType = None,
-            position: int = None, topic: str = None, nsfw: bool = None,
-            permissions_overwrites: List[Overwrite] = None,
-            parent_id: Snowflake = None,
-            default_auto_archive_duration: int = None
+            self,
+            reason: Optional[str] = None,
+            *,
+            name: APINullable[str] = MISSING,
+            type: APINullable[ChannelType] = MISSING,
+            position: APINullable[Optional[int]] = MISSING,
+            topic: APINullable[Optional[str]] = MISSING,
+            nsfw: APINullable[Optional[bool]] = MISSING,
+            permission_overwrites: APINullable[
+                Optional[List[Overwrite]]
+            ] = MISSING,
+            parent_id: APINullable[Optional[Snowflake]] = MISSING,
+            default_auto_archive_duration: APINullable[Optional[int]] = MISSING
     ) -> Union[TextChannel, NewsChannel]:
-        ...
-
-    async def edit(self, **kwargs):
-        """Edit a text channel with the given keyword arguments.
+        """Edit a news channel. Only the given attributes are changed.
 
-        Parameters
-        ----------
-        \\*\\*kwargs :
-            The keyword arguments to edit the channel with.
+        See :meth:`~pincer.objects.guild.channel.Channel.edit` for the
+        parameters.
 
         Returns
         -------
         :class:`~pincer.objects.guild.channel.Channel`
             The updated channel object.
         """
-        return await super().edit(**kwargs)
+        return await super().edit(
+            reason,
+            name=name,
+            type=type,
+            position=position,
+            topic=topic,
+            nsfw=nsfw,
+            permission_overwrites=permission_overwrites,
+            parent_id=parent_id,
+            default_auto_archive_duration=default_auto_archive_duration
+        )
 
 
 @dataclass
@@ -473,3 +684,93 @@ _channel_type_map: Dict[ChannelType, Channel] = {
     ChannelType.GUILD_CATEGORY: CategoryChannel,
     ChannelType.GUILD_NEWS: NewsChannel
 }
+
+# Maps the raw channel type integers to their channel type and class, so
+# building a channel doesn't need an enum lookup and a separate class lookup.
+_channel_dispatch: Dict[int, Tuple[ChannelType, Type[Channel]]] = {
+    channel_type.value: (
+        channel_type, _channel_type_map.get(channel_type, Channel)
+    )
+    for channel_type in ChannelType
+}
+
+
+def _build_channel(client: Client, data: Dict[str, Any]) -> Channel:
+    """Build the channel subclass which matches the type of a channel
+    payload.
+
+    Parameters
+    ----------
+    client : :class:`~pincer.client.Client`
+        The client the channel belongs to.
+    data : Dict[:class:`str`, Any]
+        The channel payload, its type is replaced by the channel type.
+
+    Returns
+    -------
+    :class:`~pincer.objects.guild.channel.Channel`
+        The channel object.
+    """
+    raw_type = data.pop("type")
+    channel_type, channel_cls = (
+        _channel_dispatch.get(raw_type)
+        or (_to_channel_type(raw_type), Channel)
+    )
+
+    data.update(construct_client_dict(client, {"type": channel_type}))
+    return channel_cls.from_dict(data)
+
+
+_from_dict_cache: Dict[Type[Channel], Callable[[Dict[str, Any]], Channel]] = {}
+
+
+def _create_from_dict(
+        cls: Type[Channel]
+) -> Callable[[Dict[str, Any]], Channel]:
+    """Generate a function which constructs ``cls`` from a dictionary.
+
+    Like :meth:`~pincer.utils.api_object.APIObject.from_dict`, keys with
+    a ``None`` value fall back to the default of the field, and a
+    :class:`TypeError` is raised when a required key is missing.
+
+    Parameters
+    ----------
+    cls : Type[:class:`~pincer.objects.guild.channel.Channel`]
+        The channel class to generate the function for.
+
+    Returns
+    -------
+    Callable[[Dict[:class:`str`, Any]], :class:`~pincer.objects.guild.channel.Channel`]
+        The generated function.
+    """  # noqa: E501
+    def missing(name: str):
+        raise TypeError(
+            f"{cls.__name__}.from_dict() missing required key: {name!r}"
+        )
+
+    namespace = {"cls": cls, "missing": missing}
+    arguments = []
+
+    for dataclass_field in fields(cls):
+        name = dataclass_field.name
+
+        if not dataclass_field.init:
+            continue
+
+        if dataclass_field.default is NO_DEFAULT:
+            fallback = f"missing({name!r})"
+        else:
+            fallback = f"_{name}_default"
+            namespace[fallback] = dataclass_field.default
+
+        arguments.append(
+            f"{name}=(v if (v := get({name!r})) is not None else {fallback})"
+        )
+
+    source = (
+        "def from_dict(data):\n"
+        "    get = data.get\n"
+        f"    return cls({', '.join(arguments)})\n"
+    )
+    exec(source, namespace)
+    return namespace["from_dict"]
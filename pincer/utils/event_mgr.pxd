@@ -0,0 +1,23 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+# Augmenting declarations for `event_mgr.py`, only used when pincer is
+# compiled with Cython. See `setup.py`.
+
+cdef class _Processable:
+    pass
+
+
+cdef class _Event(_Processable):
+    cdef public str event_name
+    cdef public object check, event, return_value
+
+    cpdef void process(self, str event_name, tuple args)
+
+
+cdef class _LoopMgr(_Processable):
+    cdef public str event_name
+    cdef public object check, events
+    cdef public bint can_expand
+
+    cpdef void process(self, str event_name, tuple args)
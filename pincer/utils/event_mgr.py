@@ -3,67 +3,31 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from asyncio import Event, wait_for as _wait_for, get_running_loop, TimeoutError
-from collections import deque
+from asyncio import (
+    Event, Queue, wait_for as _wait_for, get_running_loop,
+    TimeoutError
+)
+from collections import defaultdict
+from math import inf
+from sys import intern
 from typing import TYPE_CHECKING
 
 from ..exceptions import TimeoutError as PincerTimeoutError
 
 if TYPE_CHECKING:
-    from typing import Any, List, Union, Optional
+    from typing import Any, DefaultDict, List, Union, Optional
     from .types import CheckFunction
 
 
-class _Processable(ABC):
-
-    @abstractmethod
-    def process(self, event_name: str, *args):
-        """
-        Method that is ran when an event is received from discord.
-
-        Parameters
-        ----------
-        event_name : str
-            The name of the event.
-        *args : Any
-            Arguments to evaluate check with.
-
-        Returns
-        -------
-        bool
-            Whether the event can be set
-        """
-
-    def matches_event(self, event_name: str, *args):
-        """
-        Parameters
-        ----------
-        event_name : str
-            Name of event.
-        *args : Any
-            Arguments to eval check with.
-        """
-        if self.event_name != event_name:
-            return False
-
-        if self.check:
-            return self.check(*args)
-
-        return True
-
-
-def _lowest_value(*args):
+class _Processable:
     """
-    Returns lowest value from list of numbers. ``None`` is not counted as a
-    value. ``None`` is returned if all arguments are ``None``.
+    Base of the objects which are registered in the :class:`EventMgr`.
+    It holds no behaviour, so it can be compiled as an extension type, but
+    subclasses must implement ``process(event_name, args)``. That method is
+    ran when an event is received from discord, with the name of the event
+    and a tuple of the arguments to evaluate the check with.
     """
-    args_without_none = [n for n in args if n is not None]
-
-    if not args_without_none:
-        return None
-
-    return min(args_without_none)
+    __slots__ = ()
 
 
 class _Event(_Processable):
@@ -80,10 +44,12 @@ class _Event(_Processable):
     ----------
     event : :class:`asyncio.Event`
         Even that is used to wait until the next valid discord event.
-    return_value : Optional[str]
+    return_value : Any
         Used to store the arguments from ``can_be_set`` so they can be
-        returned later.
+        returned later. Events with a single argument store that argument
+        instead of a tuple.
     """
+    __slots__ = ("event_name", "check", "event", "return_value")
 
     def __init__(
         self,
@@ -102,14 +68,12 @@ class _Event(_Processable):
         """
         await self.event.wait()
 
-    def process(self, event_name: str, *args) -> bool:
-        if self.matches_event(event_name, *args):
-            self.return_value = args
-            self.event.set()
-
+    def process(self, event_name: str, args: tuple):
+        check = self.check
 
-class _LoopEmptyError(Exception):
-    """Raised when the _LoopMgr is empty and cannot accept new item"""
+        if check is None or check(*args):
+            self.return_value = args[0] if len(args) == 1 else args
+            self.event.set()
 
 
 class _LoopMgr(_Processable):
@@ -127,52 +91,47 @@ class _LoopMgr(_Processable):
     can_expand : bool
         Whether the queue is allowed to grow. Turned to false once the
         EventMgr's timer runs out.
-    events : :class:`collections.deque`
-        Queue of events to be processed.
-    wait : :class:`asyncio.Event`
-        Used to make ``get_next()` wait for the next event.
+    events : :class:`asyncio.Queue`
+        Queue of events to be processed. Events with a single argument are
+        queued as that argument instead of a tuple.
     """
+    __slots__ = ("event_name", "check", "can_expand", "events")
 
     def __init__(self, event_name: str, check: CheckFunction) -> None:
         self.event_name = event_name
         self.check = check
 
         self.can_expand = True
-        self.events = deque()
-        self.wait = Event()
+        self.events = Queue()
 
-    def process(self, event_name: str, *args):
+    def process(self, event_name: str, args: tuple):
         if not self.can_expand:
             return
 
-        if self.matches_event(event_name, *args):
-            self.events.append(args)
-            self.wait.set()
+        check = self.check
+
+        if check is None or check(*args):
+            self.events.put_nowait(args[0] if len(args) == 1 else args)
 
     async def get_next(self):
         """
         Returns the next item if the queue. If there are no items in the queue,
         it will return the next event that happens.
         """
-        if not self.events:
-            if not self.can_expand:
-                raise _LoopEmptyError
-
-            self.wait.clear()
-            await self.wait.wait()
-        return self.events.popleft()
+        return await self.events.get()
 
 
 class EventMgr:
     """
     Attributes
     ----------
-    event_list : List[_DiscordEvent]
-        The List of events that need to be processed.
+    event_list : DefaultDict[str, List[_Processable]]
+        The events that need to be processed, grouped by event name.
     """
 
     def __init__(self):
-        self.event_list: List[_Processable] = []
+        self.event_list: DefaultDict[str, List[_Processable]] = \
+            defaultdict(list)
 
     def process_events(self, event_name, *args):
         """
@@ -183,8 +142,19 @@ class EventMgr:
         *args : Any
             The arguments returned from the middleware for this event.
         """
-        for event in self.event_list:
-            event.process(event_name, *args)
+        for event in self.event_list.get(event_name, ()):
+            event.process(event_name, args)
+
+    def __remove_event(self, event_name: str, event: _Processable):
+        """
+        Removes a processable from its event name bucket and drops the
+        bucket once it is empty.
+        """
+        bucket = self.event_list[event_name]
+        bucket.remove(event)
+
+        if not bucket:
+            del self.event_list[event_name]
 
     async def wait_for(
         self,
@@ -206,11 +176,13 @@ class EventMgr:
         Returns
         ------
         Any
-            What the Discord API returns for this event.
+            What the Discord API returns for this event. A tuple is only
+            returned for events which have multiple arguments.
         """
 
+        event_name = intern(event_name)
         event = _Event(event_name, check)
-        self.event_list.append(event)
+        self.event_list[event_name].append(event)
 
         try:
             await _wait_for(event.wait(), timeout=timeout)
@@ -218,7 +190,9 @@ class EventMgr:
             raise PincerTimeoutError(
                 "wait_for() timed out while waiting for an event."
             )
-        self.event_list.remove(event)
+        finally:
+            self.__remove_event(event_name, event)
+
         return event.return_value
 
     async def loop_for(
@@ -245,45 +219,55 @@ class EventMgr:
         Yields
         ------
         Any
-            What the Discord API returns for this event.
+            What the Discord API returns for this event. A tuple is only
+            yielded for events which have multiple arguments.
         """
 
+        event_name = intern(event_name)
         loop_mgr = _LoopMgr(event_name, check)
-        self.event_list.append(loop_mgr)
+        self.event_list[event_name].append(loop_mgr)
 
-        loop = get_running_loop()
+        _time = get_running_loop().time
 
-        while True:
-            start_time = loop.time()
+        # ``inf`` stands for no timeout, so the remaining loop time can
+        # always be subtracted from and compared without ``None`` checks.
+        if loop_timeout is None:
+            loop_timeout = inf
 
-            try:
-                yield await _wait_for(
-                    loop_mgr.get_next(),
-                    timeout=_lowest_value(
-                        loop_timeout, iteration_timeout
-                    )
-                )
+        if iteration_timeout is None:
+            iteration_timeout = inf
+
+        try:
+            while True:
+                start_time = _time()
+                timeout = min(loop_timeout, iteration_timeout)
 
-            except TimeoutError:
-                # Loop timed out. Loop through the remaining events received
-                # before the timeout.
-                loop_mgr.can_expand = False
                 try:
-                    while True:
-                        yield await loop_mgr.get_next()
-                except _LoopEmptyError:
+                    yield await _wait_for(
+                        loop_mgr.get_next(),
+                        timeout=None if timeout == inf else timeout
+                    )
+
+                except TimeoutError:
+                    # Loop timed out. Hand out the remaining events received
+                    # before the timeout without waiting for each of them.
+                    loop_mgr.can_expand = False
+                    events = loop_mgr.events
+
+                    while not events.empty():
+                        yield events.get_nowait()
+
                     raise PincerTimeoutError(
                         "loop_for() timed out while waiting for an event"
                     )
 
-            # `not` can't be used here because there is a check for
-            # `loop_timeout == 0`
-            if loop_timeout is not None:
-                loop_timeout -= loop.time() - start_time
+                loop_timeout -= _time() - start_time
 
-                # loop_timeout can be below 0 if the user's code in the for loop
-                # takes longer than the time left in loop_timeout
+                # loop_timeout can be below 0 if the user's code in the for
+                # loop takes longer than the time left in loop_timeout
                 if loop_timeout <= 0:
                     raise PincerTimeoutError(
                         "loop_for() timed out while waiting for an event"
                     )
+        finally:
+            self.__remove_event(event_name, loop_mgr)
@@ -1,7 +1,41 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
+from os import environ
+
 from setuptools import setup
 
+# Modules which have a `.pxd` file next to them and can be compiled with
+# Cython for faster event dispatching and channel construction.
+SPEEDUP_MODULES = [
+    "pincer/objects/guild/channel.py",
+    "pincer/utils/event_mgr.py"
+]
+
+
+def get_ext_modules():
+    if environ.get("PINCER_ENABLE_SPEEDUPS") != "1":
+        return []
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError as e:
+        raise RuntimeError(
+            "PINCER_ENABLE_SPEEDUPS requires Cython. Install it and build "
+            "without build isolation, e.g. "
+            "`pip install --no-build-isolation ...`."
+        ) from e
+
+    return cythonize(
+        SPEEDUP_MODULES,
+        compiler_directives={
+            "language_level": 3,
+            # Only the `.pxd` files declare C types, the annotations of the
+            # python modules must not restrict what the public API accepts.
+            "annotation_typing": False
+        }
+    )
+
+
 if __name__ == '__main__':
-    setup()
+    setup(ext_modules=get_ext_modules())
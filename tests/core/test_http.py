@@ -0,0 +1,33 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import pytest
+
+from pincer.core.http import HTTPClient
+
+
+class TestHTTPClient:
+    @pytest.mark.asyncio
+    async def test_close_without_requests(self):
+        http = HTTPClient("token")
+
+        await http.close()
+
+        assert http._HTTPClient__client_session is None
+
+    @pytest.mark.asyncio
+    async def test_session_is_shared(self):
+        async with HTTPClient("token") as http:
+            assert http._HTTPClient__session is http._HTTPClient__session
+
+    @pytest.mark.asyncio
+    async def test_request_after_close(self):
+        http = HTTPClient("token")
+        session = http._HTTPClient__session
+
+        await http.close()
+
+        with pytest.raises(RuntimeError):
+            await http.get("users/@me")
+
+        assert http._HTTPClient__session is session
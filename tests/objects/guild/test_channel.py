@@ -0,0 +1,323 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from asyncio import sleep
+from random import random
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from pincer.exceptions import ForbiddenError
+from pincer.objects.guild.channel import (
+    CategoryChannel, Channel, NewsChannel, TextChannel, VoiceChannel
+)
+from pincer.objects.message import Embed, Message
+from pincer.utils.api_object import APIObject
+
+CHANNEL_CLASSES = (
+    Channel, TextChannel, VoiceChannel, CategoryChannel, NewsChannel
+)
+
+
+def api_object_from_dict(cls, data):
+    return APIObject.from_dict.__func__(cls, data)
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.http.delete = AsyncMock()
+    client.http.patch = AsyncMock()
+    client.http.post = AsyncMock(return_value={"id": 1})
+    return client
+
+
+def post_with_ids(client, ids):
+    """Make the message posts of the client return the given ids."""
+    ids = iter(ids)
+
+    async def post(route, data=None, **kwargs):
+        if route.endswith("/bulk-delete"):
+            return None
+
+        return {"id": next(ids)}
+
+    client.http.post.side_effect = post
+
+
+@pytest.fixture
+def channel(client):
+    return TextChannel.from_dict({
+        "id": 10, "type": 0, "_client": client, "_http": client.http
+    })
+
+
+@pytest.fixture
+def user_message():
+    with patch("pincer.objects.guild.channel.UserMessage") as user_message:
+        user_message.from_dict.side_effect = lambda data: MagicMock(
+            id=data["id"]
+        )
+        yield user_message
+
+
+class TestChannelFromDict:
+    @staticmethod
+    @pytest.mark.parametrize("cls", CHANNEL_CLASSES)
+    def test_matches_api_object(cls):
+        client = MagicMock()
+        data = {
+            "id": "123",
+            "type": 2,
+            "name": "general",
+            "topic": None,
+            "nsfw": False,
+            "position": 3,
+            "unknown_key": "ignored",
+            "_client": client,
+            "_http": client.http
+        }
+
+        channel = cls.from_dict(data)
+
+        assert type(channel) is cls
+        assert channel == api_object_from_dict(cls, data)
+
+    @staticmethod
+    @pytest.mark.parametrize("cls", CHANNEL_CLASSES)
+    def test_none_falls_back_to_default(cls):
+        data = {"id": 1, "type": 4, "name": None, "_client": None}
+
+        channel = cls.from_dict(data)
+
+        assert channel == api_object_from_dict(cls, data)
+        assert channel.name is Channel.name
+        assert channel._client is None
+
+    @staticmethod
+    @pytest.mark.parametrize("cls", CHANNEL_CLASSES)
+    @pytest.mark.parametrize("data", ({"type": 4}, {"id": None, "type": 4}))
+    def test_missing_required_key(cls, data):
+        with pytest.raises(TypeError):
+            api_object_from_dict(cls, data)
+
+        with pytest.raises(TypeError):
+            cls.from_dict(data)
+
+    @staticmethod
+    def test_returns_instance():
+        channel = TextChannel.from_dict({"id": 1, "type": 2})
+
+        assert TextChannel.from_dict(channel) is channel
+
+
+class TestChannelEdit:
+    @pytest.mark.asyncio
+    async def test_body_only_has_given_parameters(self, client, channel):
+        client.http.patch.return_value = {"id": 10, "type": 2}
+
+        edited = await channel.edit(name="general", parent_id=None)
+
+        client.http.patch.assert_awaited_once_with(
+            "channels/10", {"name": "general", "parent_id": None}, headers={}
+        )
+        assert type(edited) is VoiceChannel
+        assert edited.id == 10
+
+    @pytest.mark.asyncio
+    async def test_reason_header(self, client, channel):
+        client.http.patch.return_value = {"id": 10, "type": 0}
+
+        await channel.edit("cleanup", topic=None)
+
+        client.http.patch.assert_awaited_once_with(
+            "channels/10",
+            {"topic": None},
+            headers={"X-Audit-Log-Reason": "cleanup"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_voice_channel_forwards_parameters(self, client):
+        channel = VoiceChannel.from_dict({
+            "id": 10, "type": 2, "_client": client, "_http": client.http
+        })
+        client.http.patch.return_value = {"id": 10, "type": 2}
+
+        await channel.edit(bitrate=64000, rtc_region=None)
+
+        client.http.patch.assert_awaited_once_with(
+            "channels/10", {"bitrate": 64000, "rtc_region": None}, headers={}
+        )
+
+
+class TestChannelSend:
+    @pytest.mark.asyncio
+    async def test_send_mutated_message(self, client, channel, user_message):
+        embed = Embed(title="a")
+        message = Message(embeds=[embed])
+
+        await channel.send(message)
+        embed.title = "b"
+        message.embeds.append(Embed(title="c"))
+        await channel.send(message)
+
+        first, second = client.http.post.await_args_list
+        assert [e["title"] for e in first.args[1]["embeds"]] == ["a"]
+        assert [e["title"] for e in second.args[1]["embeds"]] == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_delete_after_batches(self, client, channel, user_message):
+        post_with_ids(client, range(1, 5))
+
+        for _ in range(3):
+            await channel.send(Message("a", delete_after=0.01))
+
+        await channel.send(Message("b", delete_after=0.3))
+
+        await sleep(0.15)
+        client.http.post.assert_awaited_with(
+            "channels/10/messages/bulk-delete", {"messages": [1, 2, 3]}
+        )
+        client.http.delete.assert_not_awaited()
+
+        await sleep(0.3)
+        client.http.delete.assert_awaited_once_with("channels/10/messages/4")
+        assert not channel._Channel__pending_deletes
+
+    @pytest.mark.asyncio
+    async def test_delete_after_not_in_fields(
+            self, client, channel, user_message
+    ):
+        await channel.send(Message("a", delete_after=0.3))
+
+        assert channel._Channel__pending_deletes
+        assert "_Channel__pending_deletes" not in channel.to_dict()
+        assert channel == TextChannel.from_dict({
+            "id": 10, "type": 0, "_client": client, "_http": client.http
+        })
+
+    @pytest.mark.asyncio
+    async def test_delete_after_forbidden(self, client, channel, user_message):
+        post_with_ids(client, range(1, 3))
+        post = client.http.post.side_effect
+
+        async def forbidden_bulk_delete(route, data=None, **kwargs):
+            if route.endswith("/bulk-delete"):
+                raise ForbiddenError()
+
+            return await post(route, data, **kwargs)
+
+        client.http.post.side_effect = forbidden_bulk_delete
+
+        for _ in range(2):
+            await channel.send(Message("a", delete_after=0.01))
+
+        await sleep(0.15)
+        assert client.http.delete.await_args_list == [
+            call("channels/10/messages/1"),
+            call("channels/10/messages/2")
+        ]
+
+
+class TestChannelBulk:
+    @pytest.mark.asyncio
+    async def test_bulk_delete_chunks(self, client, channel):
+        await channel.bulk_delete(list(range(201)))
+
+        assert client.http.post.await_args_list == [
+            call(
+                "channels/10/messages/bulk-delete",
+                {"messages": list(range(100))}
+            ),
+            call(
+                "channels/10/messages/bulk-delete",
+                {"messages": list(range(100, 200))}
+            )
+        ]
+        client.http.delete.assert_awaited_once_with("channels/10/messages/200")
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_single(self, client, channel):
+        await channel.bulk_delete([1])
+
+        client.http.delete.assert_awaited_once_with("channels/10/messages/1")
+        client.http.post.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_empty(self, client, channel):
+        await channel.bulk_delete([])
+
+        client.http.delete.assert_not_awaited()
+        client.http.post.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bulk_send_order(self, client, channel, user_message):
+        async def post(route, data=None, **kwargs):
+            await sleep(random() / 100)
+            return {"id": data["content"]}
+
+        client.http.post.side_effect = post
+        contents = [str(i) for i in range(20)]
+
+        messages = await channel.bulk_send(contents)
+
+        assert [message.id for message in messages] == contents
+
+    @pytest.mark.asyncio
+    async def test_bulk_send_concurrency(self, client, channel, user_message):
+        running = max_running = 0
+
+        async def post(route, data=None, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await sleep(0.01)
+            running -= 1
+            return {"id": 1}
+
+        client.http.post.side_effect = post
+
+        await channel.bulk_send(["a"] * 10, max_concurrency=3)
+
+        assert client.http.post.await_count == 10
+        assert max_running == 3
+
+
+class TestChannelArgumentTypes:
+    """The annotations must not be enforced when the module is compiled
+    with Cython, so these calls behave the same as in pure python."""
+
+    @pytest.mark.asyncio
+    async def test_from_id_str(self, client):
+        client.http.get = AsyncMock(return_value={"id": "1", "type": 0})
+
+        channel = await Channel.from_id(client, "1")
+
+        client.http.get.assert_awaited_once_with("channels/1")
+        assert type(channel) is TextChannel
+
+    @pytest.mark.asyncio
+    async def test_non_str_reason(self, client, channel):
+        client.http.patch.return_value = {"id": 10, "type": 0}
+
+        await channel.edit(123, name="general")
+        await channel.delete(123)
+
+        headers = {"X-Audit-Log-Reason": "123"}
+        assert client.http.patch.await_args.kwargs["headers"] == headers
+        client.http.delete.assert_awaited_once_with("channels/10", headers)
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_tuple(self, client, channel):
+        await channel.bulk_delete((1, 2))
+
+        client.http.post.assert_awaited_once_with(
+            "channels/10/messages/bulk-delete", {"messages": (1, 2)}
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_send_generator(self, client, channel, user_message):
+        messages = await channel.bulk_send(str(i) for i in range(3))
+
+        assert len(messages) == 3
+        assert client.http.post.await_count == 3
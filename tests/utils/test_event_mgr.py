@@ -0,0 +1,128 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from asyncio import ensure_future, sleep
+
+import pytest
+
+from pincer.exceptions import TimeoutError as PincerTimeoutError
+from pincer.utils.event_mgr import EventMgr, _Event, _LoopMgr
+
+
+class TestEventMgr:
+    @pytest.mark.asyncio
+    async def test_wait_for(self):
+        event_mgr = EventMgr()
+
+        future = ensure_future(event_mgr.wait_for("on_message", None, 1))
+        await sleep(0)
+
+        event_mgr.process_events("on_typing_start", "ignored")
+        event_mgr.process_events("on_message", "hello")
+
+        assert await future == "hello"
+        assert not event_mgr.event_list
+
+    @pytest.mark.asyncio
+    async def test_wait_for_multiple_arguments(self):
+        event_mgr = EventMgr()
+
+        future = ensure_future(event_mgr.wait_for("on_message", None, 1))
+        await sleep(0)
+
+        event_mgr.process_events("on_message", "a", "b")
+
+        assert await future == ("a", "b")
+
+    @pytest.mark.asyncio
+    async def test_wait_for_check(self):
+        event_mgr = EventMgr()
+
+        future = ensure_future(
+            event_mgr.wait_for("on_message", lambda msg: msg == "b", 1)
+        )
+        await sleep(0)
+
+        event_mgr.process_events("on_message", "a")
+        event_mgr.process_events("on_message", "b")
+
+        assert await future == "b"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_timeout(self):
+        event_mgr = EventMgr()
+
+        with pytest.raises(PincerTimeoutError):
+            await event_mgr.wait_for("on_message", None, 0)
+
+        assert not event_mgr.event_list
+
+    @pytest.mark.asyncio
+    async def test_loop_for(self):
+        event_mgr = EventMgr()
+        received = []
+
+        async def consume():
+            async for args in event_mgr.loop_for(
+                "on_message", None, None, 0.1
+            ):
+                received.append(args)
+
+        future = ensure_future(consume())
+        await sleep(0)
+
+        event_mgr.process_events("on_message", "a")
+        event_mgr.process_events("on_typing_start", "ignored")
+        event_mgr.process_events("on_message", "b")
+
+        with pytest.raises(PincerTimeoutError):
+            await future
+
+        assert received == ["a", "b"]
+        assert not event_mgr.event_list
+
+    @pytest.mark.asyncio
+    async def test_loop_for_break(self):
+        event_mgr = EventMgr()
+
+        async def consume():
+            async for args in event_mgr.loop_for(
+                "on_message", None, None, None
+            ):
+                return args
+
+        future = ensure_future(consume())
+        await sleep(0)
+
+        event_mgr.process_events("on_message", "a")
+
+        assert await future == "a"
+        # The generator is closed by the event loop once it is discarded.
+        await sleep(0)
+        assert not event_mgr.event_list
+
+    @pytest.mark.asyncio
+    async def test_loop_for_multiple_arguments(self):
+        event_mgr = EventMgr()
+        received = []
+
+        async def consume():
+            async for args in event_mgr.loop_for(
+                "on_message", None, None, 0.1
+            ):
+                received.append(args)
+
+        future = ensure_future(consume())
+        await sleep(0)
+
+        event_mgr.process_events("on_message", "a", "b")
+
+        with pytest.raises(PincerTimeoutError):
+            await future
+
+        assert received == [("a", "b")]
+
+    @staticmethod
+    def test_processables_have_no_dict():
+        assert not hasattr(_Event("on_message", None), "__dict__")
+        assert not hasattr(_LoopMgr("on_message", None), "__dict__")